@@ -1,7 +1,7 @@
 from django.contrib import admin 
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
-from .models import Book, CustomUser
+from .models import Author, Book, CustomUser
 
 # Custom User Admin
 class CustomUserAdmin(BaseUserAdmin):
@@ -10,6 +10,8 @@ class CustomUserAdmin(BaseUserAdmin):
     list_filter = ('is_staff', 'is_superuser', 'is_active', 'date_joined')
     search_fields = ('username', 'email')
     ordering = ('username',)
+    # Skip the unfiltered COUNT(*) Django runs on every changelist load
+    show_full_result_count = False
     
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
@@ -29,8 +31,16 @@ class CustomUserAdmin(BaseUserAdmin):
 admin.site.register(CustomUser, CustomUserAdmin)
 
 
+@admin.register(Author)
+class AuthorAdmin(admin.ModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+
+
 @admin.register(Book)
 class BookAdmin(admin.ModelAdmin):
     list_display = ('title', 'author', 'publication_year')
     list_filter = ('publication_year', 'author')
-    search_fields = ('title', 'author')
+    list_select_related = ('author',)
+    search_fields = ('title', 'author__name')
+    show_full_result_count = False
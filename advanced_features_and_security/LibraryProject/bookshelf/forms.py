@@ -1,14 +1,48 @@
 from django import forms
+from django.db import transaction
 from django.forms import ModelForm
-from .models import Book
+from .models import Author, Book
+
+__all__ = ('BookForm', 'ExampleForm')
 
 # Book Form
 # Security: Using Django ModelForm ensures automatic validation and prevents SQL injection
 # All user inputs are validated through Django's form validation system
+# The author is entered by name and looked up (or created) on save, so users
+# can add books by new authors without access to the Author admin
 class BookForm(ModelForm):
+    author = forms.CharField(max_length=100)
+
+    field_order = ['title', 'author', 'publication_year']
+
     class Meta:
         model = Book
-        fields = ['title', 'author', 'publication_year']
+        fields = ['title', 'publication_year']
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.instance.pk:
+            self.initial.setdefault('author', self.instance.author.name)
+
+    def get_author(self):
+        """Return the Author named in the form, creating it if needed."""
+        author, _ = Author.objects.get_or_create(name=self.cleaned_data['author'])
+        return author
+
+    def save(self, commit=True):
+        """
+        Save the book, creating its author if needed, in one transaction.
+        
+        With commit=False nothing is written: a new author is attached unsaved
+        and must be saved by the caller before the book.
+        """
+        if not commit:
+            name = self.cleaned_data['author']
+            self.instance.author = Author.objects.filter(name=name).first() or Author(name=name)
+            return super().save(commit=False)
+        with transaction.atomic():
+            self.instance.author = self.get_author()
+            return super().save()
 
 
 # Example Form (required for the security checks)
@@ -8,51 +8,85 @@ This command creates three groups:
 
 Run this command after migrations: python manage.py setup_groups
 """
-from django.core.management.base import BaseCommand
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
-from bookshelf.models import Book
+
+
+# Permissions assigned to each group, as (app_label, model, codename)
+GROUP_PERMS = {
+    'Viewers': [
+        ('bookshelf', 'book', 'can_view'),
+    ],
+    'Editors': [
+        ('bookshelf', 'book', 'can_view'),
+        ('bookshelf', 'book', 'can_create'),
+        ('bookshelf', 'book', 'can_edit'),
+    ],
+    'Admins': [
+        ('bookshelf', 'book', 'can_view'),
+        ('bookshelf', 'book', 'can_create'),
+        ('bookshelf', 'book', 'can_edit'),
+        ('bookshelf', 'book', 'can_delete'),
+    ],
+}
 
 
 class Command(BaseCommand):
     help = 'Creates user groups (Viewers, Editors, Admins) and assigns permissions'
 
     def handle(self, *args, **options):
-        # Get content type for Book model
-        content_type = ContentType.objects.get_for_model(Book)
+        # Resolve content types for every model in the spec in one query
+        models = {
+            (app_label, model_name): apps.get_model(app_label, model_name)
+            for specs in GROUP_PERMS.values()
+            for app_label, model_name, _ in specs
+        }
+        content_types = ContentType.objects.get_for_models(*models.values())
         
-        # Get all book permissions
-        can_view = Permission.objects.get(codename='can_view', content_type=content_type)
-        can_create = Permission.objects.get(codename='can_create', content_type=content_type)
-        can_edit = Permission.objects.get(codename='can_edit', content_type=content_type)
-        can_delete = Permission.objects.get(codename='can_delete', content_type=content_type)
+        # Get all needed permissions in a single query
+        codenames = {codename for specs in GROUP_PERMS.values() for _, _, codename in specs}
+        perms = {
+            (p.content_type_id, p.codename): p
+            for p in Permission.objects.filter(
+                content_type__in=content_types.values(),
+                codename__in=codenames,
+            )
+        }
         
-        # Create Viewers group (can only view)
-        viewers_group, created = Group.objects.get_or_create(name='Viewers')
-        viewers_group.permissions.add(can_view)
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Viewers group'))
-        else:
-            self.stdout.write(self.style.SUCCESS('Viewers group already exists'))
+        # Fetch existing groups, then create any missing ones in a single INSERT
+        names = list(GROUP_PERMS)
+        groups = {g.name: g for g in Group.objects.filter(name__in=names)}
+        missing = [name for name in names if name not in groups]
+        if missing:
+            Group.objects.bulk_create([Group(name=name) for name in missing], ignore_conflicts=True)
+            groups.update((g.name, g) for g in Group.objects.filter(name__in=missing))
         
-        # Create Editors group (can view, create, and edit)
-        editors_group, created = Group.objects.get_or_create(name='Editors')
-        editors_group.permissions.add(can_view, can_create, can_edit)
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Editors group'))
-        else:
-            self.stdout.write(self.style.SUCCESS('Editors group already exists'))
+        # Attach permissions to all groups with a single bulk INSERT
+        through = Group.permissions.through
+        links = []
+        for name, specs in GROUP_PERMS.items():
+            for app_label, model_name, codename in specs:
+                content_type = content_types[models[app_label, model_name]]
+                try:
+                    permission = perms[content_type.pk, codename]
+                except KeyError:
+                    raise CommandError(
+                        f'Permission {app_label}.{codename} not found. Run migrations first.'
+                    ) from None
+                links.append(through(group_id=groups[name].pk, permission_id=permission.pk))
+        through.objects.bulk_create(links, ignore_conflicts=True)
         
-        # Create Admins group (all permissions)
-        admins_group, created = Group.objects.get_or_create(name='Admins')
-        admins_group.permissions.add(can_view, can_create, can_edit, can_delete)
-        if created:
-            self.stdout.write(self.style.SUCCESS('Created Admins group'))
-        else:
-            self.stdout.write(self.style.SUCCESS('Admins group already exists'))
+        for name in names:
+            if name in missing:
+                self.stdout.write(self.style.SUCCESS(f'Created {name} group'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'{name} group already exists'))
         
         self.stdout.write(self.style.SUCCESS('\nGroups setup completed successfully!'))
-        self.stdout.write(self.style.SUCCESS('Viewers: can_view'))
-        self.stdout.write(self.style.SUCCESS('Editors: can_view, can_create, can_edit'))
-        self.stdout.write(self.style.SUCCESS('Admins: can_view, can_create, can_edit, can_delete'))
-
+        # Report current permissions; prefetch loads them all in one extra query
+        summary = {g.name: g for g in Group.objects.filter(name__in=names).prefetch_related('permissions')}
+        for name in names:
+            granted = ', '.join(p.codename for p in summary[name].permissions.all())
+            self.stdout.write(self.style.SUCCESS(f'{name}: {granted}'))
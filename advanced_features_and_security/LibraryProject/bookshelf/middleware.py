@@ -5,10 +5,34 @@ This middleware adds Content Security Policy headers to responses to help preven
 cross-site scripting (XSS) attacks by specifying which domains can be used to
 load content in the application.
 """
-from django.utils.deprecation import MiddlewareMixin
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
 
 
-class CSPMiddleware(MiddlewareMixin):
+# Basic CSP policy, built once at import time rather than on every response
+# 'self' allows resources from the same origin
+# 'unsafe-inline' is needed for Django's inline scripts/styles (use with caution)
+# In production, consider removing 'unsafe-inline' and using nonces or hashes
+CSP_POLICY = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data:; "
+    "font-src 'self'; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none';"
+)
+
+# Content types a browser renders as a document and that can run scripts.
+# They always get the header, even when served from STATIC_URL/MEDIA_URL.
+DOCUMENT_CONTENT_TYPES = ('text/html', 'application/xhtml+xml', 'image/svg+xml')
+
+# Content types that are never rendered as a document, so CSP has no effect
+# on them.
+NON_DOCUMENT_CONTENT_TYPES = ('image/', 'font/', 'audio/', 'video/')
+
+
+class CSPMiddleware:
     """
     Middleware to add Content Security Policy headers to responses.
     
@@ -16,23 +40,48 @@ class CSPMiddleware(MiddlewareMixin):
     and executed on the page. This is a basic implementation.
     
     For production, consider using django-csp package for more advanced configuration.
+    
+    Supports both sync and async request handling, so ASGI deployments don't
+    pay for a sync_to_async thread hop on every request.
+    
+    Static/media files, non-document responses and 304 Not Modified responses
+    are left without the header, except for HTML and SVG, which can run
+    scripts wherever they are served from.
     """
+    sync_capable = True
+    async_capable = True
     
-    def process_response(self, request, response):
-        # Basic CSP policy
-        # 'self' allows resources from the same origin
-        # 'unsafe-inline' is needed for Django's inline scripts/styles (use with caution)
-        # In production, consider removing 'unsafe-inline' and using nonces or hashes
-        csp_policy = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline'; "
-            "style-src 'self' 'unsafe-inline'; "
-            "img-src 'self' data:; "
-            "font-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none';"
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        # Read once at startup, before any script prefix is applied, so they
+        # are compared against request.path_info
+        self.skip_prefixes = tuple(
+            url for url in (settings.STATIC_URL, settings.MEDIA_URL) if url
         )
-        
-        response['Content-Security-Policy'] = csp_policy
+    
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+    
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        return self.process_response(request, response)
+    
+    def process_response(self, request, response):
+        if self.needs_csp(request, response):
+            response.headers['Content-Security-Policy'] = CSP_POLICY
         return response
-
+    
+    def needs_csp(self, request, response):
+        if response.status_code == 304:
+            return False
+        content_type = response.get('Content-Type', '')
+        if content_type.startswith(DOCUMENT_CONTENT_TYPES):
+            return True
+        if self.skip_prefixes and request.path_info.startswith(self.skip_prefixes):
+            return False
+        return not content_type.startswith(NON_DOCUMENT_CONTENT_TYPES)
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-15 21:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['title'], name='bookshelf_b_title_468167_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author'], name='bookshelf_b_author_5aeed2_idx'),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.8 on 2026-10-15 21:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_authors(apps, schema_editor):
+    """Create an Author per distinct author name and point each book at it."""
+    Author = apps.get_model('bookshelf', 'Author')
+    Book = apps.get_model('bookshelf', 'Book')
+    names = Book.objects.values_list('author_name', flat=True).distinct()
+    Author.objects.bulk_create([Author(name=name) for name in names], ignore_conflicts=True)
+    for author in Author.objects.filter(name__in=names):
+        Book.objects.filter(author_name=author.name).update(author=author)
+
+
+def unpopulate_authors(apps, schema_editor):
+    Author = apps.get_model('bookshelf', 'Author')
+    for author in Author.objects.all():
+        author.books.update(author_name=author.name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0002_book_title_author_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Author',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+            ],
+        ),
+        migrations.RemoveIndex(
+            model_name='book',
+            name='bookshelf_b_author_5aeed2_idx',
+        ),
+        migrations.RenameField(
+            model_name='book',
+            old_name='author',
+            new_name='author_name',
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='author_name',
+            field=models.CharField(max_length=100, null=True),
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='author',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='books', to='bookshelf.author'),
+        ),
+        migrations.RunPython(populate_authors, unpopulate_authors),
+        migrations.RemoveField(
+            model_name='book',
+            name='author_name',
+        ),
+        migrations.AlterField(
+            model_name='book',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='books', to='bookshelf.author'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookshelf', '0003_author_book_author_fk'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['publication_year', 'author'], name='book_year_author_idx'),
+        ),
+    ]
@@ -45,10 +45,18 @@ class CustomUser(AbstractUser):
         return self.username
 
 
+# Author Model
+class Author(models.Model):
+    name = models.CharField(max_length=100, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
 # Book Model
 class Book(models.Model):
     title = models.CharField(max_length=200)
-    author = models.CharField(max_length=100)
+    author = models.ForeignKey(Author, on_delete=models.PROTECT, related_name='books')
     publication_year = models.IntegerField()
 
     class Meta:
@@ -59,6 +67,11 @@ class Book(models.Model):
             ('can_edit', 'Can edit book'),
             ('can_delete', 'Can delete book'),
         ]
+        indexes = [
+            models.Index(fields=['title']),
+            # Serves the admin's publication_year/author list filters
+            models.Index(fields=['publication_year', 'author'], name='book_year_author_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} by {self.author} ({self.publication_year})"
\ No newline at end of file
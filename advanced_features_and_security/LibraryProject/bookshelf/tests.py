@@ -1,3 +1,124 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.db import DatabaseError, connection
+from django.db.migrations.executor import MigrationExecutor
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, TransactionTestCase
+
+from .forms import BookForm
+from .middleware import CSPMiddleware
+from .models import Author, Book
+
+
+class BookFormTests(TestCase):
+    def test_creates_new_author_by_name(self):
+        form = BookForm({'title': '1984', 'author': 'George Orwell', 'publication_year': 1949})
+        self.assertTrue(form.is_valid(), form.errors)
+        book = form.save()
+        self.assertEqual(book.author.name, 'George Orwell')
+        self.assertEqual(Author.objects.count(), 1)
+
+    def test_reuses_existing_author(self):
+        author = Author.objects.create(name='George Orwell')
+        form = BookForm({'title': 'Animal Farm', 'author': 'George Orwell', 'publication_year': 1945})
+        self.assertTrue(form.is_valid(), form.errors)
+        self.assertEqual(form.save().author, author)
+        self.assertEqual(Author.objects.count(), 1)
+
+    def test_save_without_commit_writes_nothing(self):
+        form = BookForm({'title': '1984', 'author': 'George Orwell', 'publication_year': 1949})
+        self.assertTrue(form.is_valid(), form.errors)
+        book = form.save(commit=False)
+        self.assertEqual(book.author.name, 'George Orwell')
+        self.assertFalse(Author.objects.exists())
+        self.assertFalse(Book.objects.exists())
+
+    def test_failed_book_insert_leaves_no_author(self):
+        form = BookForm({'title': '1984', 'author': 'George Orwell', 'publication_year': 1949})
+        self.assertTrue(form.is_valid(), form.errors)
+        with mock.patch.object(Book, 'save_base', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                form.save()
+        self.assertFalse(Author.objects.exists())
+
+    def test_initial_author_name_for_existing_book(self):
+        author = Author.objects.create(name='George Orwell')
+        book = Book.objects.create(title='1984', author=author, publication_year=1949)
+        self.assertEqual(BookForm(instance=book).initial['author'], 'George Orwell')
+
+
+class AuthorMigrationTests(TransactionTestCase):
+    """Tests for the data migration that moves Book.author into Author rows."""
+    before = [('bookshelf', '0002_book_title_author_indexes')]
+    after = [('bookshelf', '0003_author_book_author_fk')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_forward_creates_authors_and_links_books(self):
+        apps = self.migrate(self.before)
+        OldBook = apps.get_model('bookshelf', 'Book')
+        OldBook.objects.create(title='1984', author='George Orwell', publication_year=1949)
+        OldBook.objects.create(title='Animal Farm', author='George Orwell', publication_year=1945)
+        OldBook.objects.create(title='Emma', author='Jane Austen', publication_year=1815)
+
+        apps = self.migrate(self.after)
+        NewAuthor = apps.get_model('bookshelf', 'Author')
+        NewBook = apps.get_model('bookshelf', 'Book')
+        self.assertEqual(
+            sorted(NewAuthor.objects.values_list('name', flat=True)),
+            ['George Orwell', 'Jane Austen'],
+        )
+        self.assertEqual(
+            dict(NewBook.objects.values_list('title', 'author__name')),
+            {'1984': 'George Orwell', 'Animal Farm': 'George Orwell', 'Emma': 'Jane Austen'},
+        )
+
+    def test_reverse_restores_author_names(self):
+        apps = self.migrate(self.after)
+        NewAuthor = apps.get_model('bookshelf', 'Author')
+        NewBook = apps.get_model('bookshelf', 'Book')
+        author = NewAuthor.objects.create(name='Jane Austen')
+        NewBook.objects.create(title='Emma', author=author, publication_year=1815)
+
+        apps = self.migrate(self.before)
+        OldBook = apps.get_model('bookshelf', 'Book')
+        self.assertEqual(list(OldBook.objects.values_list('title', 'author')), [('Emma', 'Jane Austen')])
+
+
+class CSPMiddlewareTests(SimpleTestCase):
+    def has_csp(self, path, content_type='text/html', status=200):
+        middleware = CSPMiddleware(lambda request: HttpResponse(content_type=content_type, status=status))
+        response = middleware(RequestFactory().get(path))
+        return 'Content-Security-Policy' in response
+
+    def test_html_page_gets_header(self):
+        self.assertTrue(self.has_csp('/bookshelf/'))
+
+    def test_static_and_media_assets_skip_header(self):
+        self.assertFalse(self.has_csp('/static/app.css', 'text/css'))
+        self.assertFalse(self.has_csp('/media/photo.png', 'image/png'))
+
+    def test_non_document_types_skip_header(self):
+        self.assertFalse(self.has_csp('/photo.png', 'image/png'))
+        self.assertFalse(self.has_csp('/font.woff2', 'font/woff2'))
+
+    def test_svg_keeps_header_everywhere(self):
+        for path in ('/x.svg', '/static/a.svg', '/media/a.svg'):
+            with self.subTest(path=path):
+                self.assertTrue(self.has_csp(path, 'image/svg+xml'))
+
+    def test_html_under_static_and_media_keeps_header(self):
+        for path in ('/static/a.html', '/media/a.html'):
+            with self.subTest(path=path):
+                self.assertTrue(self.has_csp(path, 'text/html; charset=utf-8'))
+
+    def test_not_modified_skips_header(self):
+        self.assertFalse(self.has_csp('/bookshelf/', status=304))
@@ -1,8 +1,15 @@
 from django.urls import path
+from django.views.decorators.cache import cache_control
+from django.views.decorators.vary import vary_on_cookie
 from . import views
 
+# The book list is per-user (permission-dependent) and changes after every
+# write that redirects here, so browsers may keep it privately but must
+# revalidate before reusing it.
+book_list = cache_control(private=True, no_cache=True)(vary_on_cookie(views.BookListView.as_view()))
+
 urlpatterns = [
-    path('bookshelf/', views.book_list, name='book_list'),
+    path('bookshelf/', book_list, name='book_list'),
     path('bookshelf/create/', views.book_create, name='book_create'),
     path('bookshelf/<int:pk>/edit/', views.book_edit, name='book_edit'),
     path('bookshelf/<int:pk>/delete/', views.book_delete, name='book_delete'),
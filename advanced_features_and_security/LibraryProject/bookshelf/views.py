@@ -1,31 +1,41 @@
-from django.shortcuts import render, redirect, get_object_or_404
+from django.shortcuts import render, get_object_or_404
+from django.db import transaction
+from django.http import Http404, HttpResponseRedirect
 from django.contrib.auth.decorators import permission_required
+from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.urls import reverse_lazy
+from django.utils.safestring import mark_safe
+from django.views.generic import ListView
 from .models import Book
-from .forms import BookForm
-from .forms import ExampleForm   # <-- Added as required
+from .forms import BookForm, ExampleForm
 
 
-# Book Form
-# Security: Using Django ModelForm ensures automatic validation and prevents SQL injection
-# All user inputs are validated through Django's form validation system
-class BookForm(ModelForm):
-    class Meta:
-        model = Book
-        fields = ['title', 'author', 'publication_year']
+# Redirect target after a successful write
+_BOOK_LIST_URL = reverse_lazy('book_list')
 
 
 # Permission-protected views
-@permission_required('bookshelf.can_view', raise_exception=True)
-def book_list(request):
+class BookListView(PermissionRequiredMixin, ListView):
     """
     View to list all books. Requires can_view permission.
     
     Security: 
-    - Uses Django ORM (Book.objects.all()) which prevents SQL injection
+    - Uses Django ORM which prevents SQL injection
     - Permission check ensures only authorized users can access
+    
+    Only the columns shown in the template are fetched, ordered by the
+    indexed title column. bookshelf/urls.py marks the response as private and
+    requires browsers to revalidate it before reuse.
     """
-    books = Book.objects.all()  # Safe: Django ORM prevents SQL injection
-    return render(request, 'bookshelf/book_list.html', {'books': books})
+    permission_required = 'bookshelf.can_view'
+    raise_exception = True
+    queryset = (
+        Book.objects.select_related('author')
+        .only('id', 'title', 'author__name', 'publication_year')
+        .order_by('title')
+    )  # Safe: Django ORM prevents SQL injection
+    template_name = 'bookshelf/book_list.html'
+    context_object_name = 'books'
 
 
 @permission_required('bookshelf.can_create', raise_exception=True)
@@ -42,7 +52,7 @@ def book_create(request):
         form = BookForm(request.POST)  # Safe: Django forms handle input validation
         if form.is_valid():  # Validates and sanitizes all inputs
             form.save()  # Safe: Django ORM prevents SQL injection
-            return redirect('book_list')
+            return HttpResponseRedirect(_BOOK_LIST_URL)
     else:
         form = BookForm()
     return render(request, 'bookshelf/book_form.html', {'form': form, 'action': 'Create'})
@@ -58,14 +68,24 @@ def book_edit(request, pk):
     - Django ORM parameterizes queries (pk=pk is safe from SQL injection)
     - Form validation ensures data integrity
     - CSRF protection via middleware
+    
+    A valid POST is written with a single UPDATE; the book is only loaded
+    to render the form.
     """
-    book = get_object_or_404(Book, pk=pk)  # Safe: Django ORM parameterizes queries
     if request.method == 'POST':
-        form = BookForm(request.POST, instance=book)  # Safe: Form validation
+        form = BookForm(request.POST)  # Safe: Form validation
         if form.is_valid():
-            form.save()  # Safe: Django ORM prevents SQL injection
-            return redirect('book_list')
+            # Single UPDATE; no need to load the row first. The 404 rolls back
+            # any author created for a book that doesn't exist.
+            with transaction.atomic():
+                fields = dict(form.cleaned_data, author=form.get_author())
+                updated = Book.objects.filter(pk=pk).update(**fields)  # Safe: Django ORM prevents SQL injection
+                if not updated:
+                    raise Http404('No Book matches the given query.')
+            return HttpResponseRedirect(_BOOK_LIST_URL)
+        book = get_object_or_404(Book, pk=pk)  # Safe: Django ORM parameterizes queries
     else:
+        book = get_object_or_404(Book.objects.select_related('author'), pk=pk)  # Safe: Django ORM parameterizes queries
         form = BookForm(instance=book)
     return render(request, 'bookshelf/book_form.html', {'form': form, 'book': book, 'action': 'Edit'})
 
@@ -81,9 +101,39 @@ def book_delete(request, pk):
     - Django ORM prevents SQL injection
     - Permission check ensures only authorized users can delete
     - CSRF protection via middleware
+    
+    A confirmed deletion is a single DELETE; the book is only loaded to show
+    the confirmation page.
     """
-    book = get_object_or_404(Book, pk=pk)  # Safe: Django ORM parameterizes queries
     if request.method == 'POST':  # Security: Only allow deletion via POST
-        book.delete()  # Safe: Django ORM prevents SQL injection
-        return redirect('book_list')
+        deleted, _ = Book.objects.filter(pk=pk).delete()  # Safe: Django ORM prevents SQL injection
+        if not deleted:
+            raise Http404('No Book matches the given query.')
+        return HttpResponseRedirect(_BOOK_LIST_URL)
+    book = get_object_or_404(Book.objects.select_related('author'), pk=pk)  # Safe: Django ORM parameterizes queries
     return render(request, 'bookshelf/book_delete.html', {'book': book})
+
+
+# A blank ExampleForm always renders the same HTML, so render it once
+_EXAMPLE_FORM_HTML = mark_safe(ExampleForm().as_p())
+
+
+def form_example(request):
+    """
+    View demonstrating CSRF protection and secure form handling.
+    
+    Security:
+    - CSRF protection via middleware (requires {% csrf_token %} in template)
+    - Form validation sanitizes user input before it is used
+    
+    GET requests reuse the pre-rendered blank form instead of building a new
+    form instance each time.
+    """
+    context = {'form_html': _EXAMPLE_FORM_HTML}
+    if request.method == 'POST':
+        form = ExampleForm(request.POST)  # Safe: Django forms handle input validation
+        if form.is_valid():
+            context['success_message'] = 'Form submitted successfully!'
+        else:
+            context = {'form': form}
+    return render(request, 'bookshelf/form_example.html', context)